@@ -1,33 +1,58 @@
+import threading
 import time
 
 
 class ActivityTracker:
     """Activity state management for the state machine."""
 
-    def __init__(self):
-        """Initialize with current timestamps."""
-        self._last_activity_time = time.time()
-        self._last_activity_monotonic = time.monotonic()
+    THROTTLE_INTERVAL_SECONDS = 0.1
+
+    def __init__(self, wakeup: threading.Event | None = None):
+        """Initialize with current timestamps and an optional activity wakeup event."""
+        self._last_activity = (time.time(), time.monotonic())
+        self._wakeup = wakeup
+        self._wakeup_armed = False
 
     def on_activity(self, x=None, y=None, button=None, pressed=None, key=None):
-        """Update last activity timestamp."""
-        self._last_activity_time = time.time()
-        self._last_activity_monotonic = time.monotonic()
+        """Update last activity timestamp for discrete input like keys and clicks."""
+        if self._wakeup_armed:
+            self._wakeup_armed = False
+            self._wakeup.set()
+
+        self._last_activity = (time.time(), time.monotonic())
+
+    def on_pointer_activity(self, x=None, y=None, dx=None, dy=None):
+        """Update last activity timestamp for pointer moves, at most once per throttle interval."""
+        if self._wakeup_armed:
+            self._wakeup_armed = False
+            self._wakeup.set()
+
+        now_monotonic = time.monotonic()
+        if now_monotonic - self._last_activity[1] < self.THROTTLE_INTERVAL_SECONDS:
+            return
+        self._last_activity = (time.time(), now_monotonic)
+
+    def arm_wakeup(self):
+        """Set the wakeup event once on the next user activity."""
+        if self._wakeup is not None:
+            self._wakeup_armed = True
+
+    def get_last_activity(self) -> tuple[float, float]:
+        """Return wall-clock and monotonic timestamps of last activity as one pair."""
+        return self._last_activity
 
     def get_last_activity_time(self) -> float:
         """Return wall-clock timestamp of last activity."""
-        return self._last_activity_time
+        return self._last_activity[0]
 
     def get_last_activity_monotonic(self) -> float:
         """Return monotonic timestamp of last activity."""
-        return self._last_activity_monotonic
+        return self._last_activity[1]
 
     def set_last_activity_time(
         self, timestamp: float, monotonic_timestamp: float | None = None
     ):
         """Set last activity timestamps for initialization."""
-        self._last_activity_time = timestamp
         if monotonic_timestamp is None:
-            self._last_activity_monotonic = time.monotonic()
-        else:
-            self._last_activity_monotonic = monotonic_timestamp
+            monotonic_timestamp = time.monotonic()
+        self._last_activity = (timestamp, monotonic_timestamp)
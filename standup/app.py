@@ -4,18 +4,20 @@ import logging
 import time
 import signal
 import atexit
-import sys
+import threading
 
 from pynput import keyboard, mouse
 
 from .activity_tracker import ActivityTracker
 from .model.app_config import AppConfig
 from .model.app_state import AppState
+from .model.saved_state import SavedState
 from .model.state import State, state_to_activity
 from .notifier import Notifier
 from .session_logger import SessionLogger
 from .state_handlers import StateHandler
 from .state_persistence import StatePersistence
+from .state_writer import StateWriter
 from .thread_manager import ThreadManager
 from .utils import format_duration
 
@@ -24,6 +26,10 @@ logger = logging.getLogger(__name__)
 COLLECTION_INTERVAL_SECONDS = 5
 TEST_MODE_DURATION_MULTIPLIER = 3
 TEST_MODE_BUFFER_SECONDS = 1
+TEST_MODE_DURATION_SECONDS = (
+    COLLECTION_INTERVAL_SECONDS * TEST_MODE_DURATION_MULTIPLIER
+    + TEST_MODE_BUFFER_SECONDS
+)
 MINIMUM_SESSION_DURATION_SECONDS = 1
 
 
@@ -32,17 +38,26 @@ class App:
 
     def __init__(self, config: AppConfig):
         self.config = config
-        self.activity_tracker = ActivityTracker()
+        self._wakeup = threading.Event()
+        self._shutdown_requested = False
+        self._shutdown_signal: int | None = None
+        self._final_state_saved = False
+        self.activity_tracker = ActivityTracker(self._wakeup)
         self.session_logger = SessionLogger()
         self.notifier = Notifier()
         self.state_handler = StateHandler(
             self.activity_tracker, self.session_logger, self.notifier
         )
+        self._state_handlers = {
+            State.ACTIVE: self.state_handler.handle_active_state,
+            State.IDLE: self.state_handler.handle_idle_state,
+        }
         self.state_persistence = StatePersistence()
+        self.state_writer = StateWriter(self.state_persistence)
         self.thread_manager = ThreadManager()
         self.app_state = self._initialize_app_state()
         self.all_threads = []
-        self.last_save_time = time.time()
+        self.last_save_monotonic = time.monotonic()
 
     def run(self):
         """Main entry point: initialize components and run the state machine."""
@@ -73,85 +88,91 @@ class App:
 
     def _resume_from_saved_state(self):
         """Try to load previously saved runtime state and resume from it."""
-        resumed_from_saved_state = False
         try:
             saved = self.state_persistence.load(self.config)
-            if saved:
-                saved_state_name = saved.get("current_state")
-                try:
-                    saved_state = State[saved_state_name]
-                except Exception:
-                    saved_state = self.app_state.current_state
-
-                saved_session_start = float(
-                    saved.get("session_start_time", self.app_state.session_start_time)
-                )
-                saved_break_reminder = bool(saved.get("break_reminder_shown", False))
-                saved_last_activity = float(
-                    saved.get("last_activity_time", time.time())
-                )
-
-                current_time = time.time()
-                current_monotonic = time.monotonic()
-                time_since_last_activity = current_time - saved_last_activity
-
-                if (
-                    saved_state == State.ACTIVE
-                    and time_since_last_activity >= self.config.break_duration_sec
-                ):
-                    active_session_end = (
-                        saved_last_activity + self.config.break_duration_sec
-                    )
-                    active_session_duration = active_session_end - saved_session_start
-
-                    if active_session_duration > MINIMUM_SESSION_DURATION_SECONDS:
-                        self.session_logger.log(
-                            self.config,
-                            state_to_activity(saved_state),
-                            saved_session_start,
-                            active_session_end,
-                            active_session_duration,
-                        )
-
-                    break_duration = current_time - active_session_end
-                    self.notifier.show(
-                        "Welcome Back!",
-                        f"Your break lasted {format_duration(break_duration)}.",
-                        "Starting new session.",
-                    )
-
-                    self.app_state = self.app_state._replace(
-                        current_state=State.IDLE,
-                        session_start_time=active_session_end,
-                        session_start_monotonic=current_monotonic,
-                        activation_candidate_start_monotonic=None,
-                        break_reminder_shown=False,
-                    )
-                    self.activity_tracker.set_last_activity_time(
-                        saved_last_activity, current_monotonic
-                    )
-                else:
-                    self.app_state = self.app_state._replace(
-                        current_state=saved_state,
-                        session_start_time=saved_session_start,
-                        session_start_monotonic=current_monotonic,
-                        activation_candidate_start_monotonic=None,
-                        break_reminder_shown=saved_break_reminder,
-                    )
-                    self.activity_tracker.set_last_activity_time(
-                        current_time, current_monotonic
-                    )
-
-                resumed_from_saved_state = True
-                logger.info("Resumed state from saved runtime state: %s", saved)
         except Exception:
             logger.exception("Failed to load saved runtime state")
+            saved = None
 
-        if not resumed_from_saved_state:
+        if saved is None:
             self.activity_tracker.set_last_activity_time(
                 self.app_state.session_start_time,
                 self.app_state.session_start_monotonic,
             )
+            return
+
+        current_time = time.time()
+        current_monotonic = time.monotonic()
+        self.app_state, last_activity_time, missed_session = (
+            self._compute_resumed_state(saved, current_time, current_monotonic)
+        )
+        self.activity_tracker.set_last_activity_time(
+            last_activity_time, current_monotonic
+        )
+
+        if missed_session is not None:
+            session_start, session_end = missed_session
+            session_duration = session_end - session_start
+            if session_duration > MINIMUM_SESSION_DURATION_SECONDS:
+                self.session_logger.log(
+                    self.config,
+                    state_to_activity(State.ACTIVE),
+                    session_start,
+                    session_end,
+                    session_duration,
+                )
+
+            break_duration = current_time - session_end
+            self.notifier.show(
+                "Welcome Back!",
+                f"Your break lasted {format_duration(break_duration)}.",
+                "Starting new session.",
+            )
+
+        logger.info("Resumed state from saved runtime state: %s", saved)
+
+    def _compute_resumed_state(
+        self, saved: SavedState, current_time: float, current_monotonic: float
+    ) -> tuple[AppState, float, tuple[float, float] | None]:
+        """Return resumed state, last activity time, and any missed work session."""
+        saved_state = saved.current_state or self.app_state.current_state
+        saved_session_start = (
+            saved.session_start_time
+            if saved.session_start_time is not None
+            else self.app_state.session_start_time
+        )
+        saved_last_activity = (
+            saved.last_activity_time
+            if saved.last_activity_time is not None
+            else current_time
+        )
+
+        if (
+            saved_state is State.ACTIVE
+            and current_time - saved_last_activity >= self.config.break_duration_sec
+        ):
+            active_session_end = saved_last_activity + self.config.break_duration_sec
+            resumed_state = AppState(
+                current_state=State.IDLE,
+                session_start_time=active_session_end,
+                session_start_monotonic=current_monotonic,
+                activation_candidate_start_monotonic=None,
+                break_reminder_shown=False,
+            )
+            return (
+                resumed_state,
+                saved_last_activity,
+                (saved_session_start, active_session_end),
+            )
+
+        resumed_state = AppState(
+            current_state=saved_state,
+            session_start_time=saved_session_start,
+            session_start_monotonic=current_monotonic,
+            activation_candidate_start_monotonic=None,
+            break_reminder_shown=saved.break_reminder_shown,
+        )
+        return resumed_state, current_time, None
 
     def _configure_for_test_mode(self):
         """Modify config for test mode."""
@@ -167,9 +188,9 @@ class App:
     def _setup_monitoring_system(self) -> list:
         """Create and return all monitoring threads and listeners."""
         mouse_listener = mouse.Listener(
-            on_move=self.activity_tracker.on_activity,
+            on_move=self.activity_tracker.on_pointer_activity,
             on_click=self.activity_tracker.on_activity,
-            on_scroll=self.activity_tracker.on_activity,
+            on_scroll=self.activity_tracker.on_pointer_activity,
         )
         keyboard_listener = keyboard.Listener(
             on_press=self.activity_tracker.on_activity
@@ -177,98 +198,142 @@ class App:
         return [mouse_listener, keyboard_listener]
 
     def _register_signal_handlers(self):
-        """Register signal handlers to save state on termination."""
+        """Register signal handlers that stop the main loop for a clean shutdown."""
 
-        def _save_state_and_exit(signum=None, frame=None):
-            logger.info("Received signal %s - saving runtime state and exiting", signum)
-            try:
-                self.state_persistence.save(
-                    self.config,
-                    self.app_state,
-                    self.activity_tracker.get_last_activity_time(),
-                )
-            except Exception:
-                logger.exception("Failed to save runtime state in signal handler")
-            try:
-                sys.exit(0)
-            except SystemExit:
-                raise
+        def _request_shutdown(signum=None, frame=None):
+            # Flags only: Event.set() could deadlock on a lock held by the main thread
+            self._shutdown_signal = signum
+            self._shutdown_requested = True
 
         try:
-            signal.signal(signal.SIGINT, _save_state_and_exit)
+            signal.signal(signal.SIGINT, _request_shutdown)
         except Exception:
             logger.exception("Failed to register SIGINT handler")
         try:
-            signal.signal(signal.SIGTERM, _save_state_and_exit)
+            signal.signal(signal.SIGTERM, _request_shutdown)
         except Exception:
             logger.debug("SIGTERM not available on this platform")
 
         def _on_exit():
-            try:
-                self.state_persistence.save(
-                    self.config,
-                    self.app_state,
-                    self.activity_tracker.get_last_activity_time(),
-                )
-            except Exception:
-                logger.exception("Failed to save runtime state in atexit handler")
+            self._save_runtime_state()
+            self.session_logger.close()
 
         atexit.register(_on_exit)
 
     def _run_main_loop(self):
-        """Run main state machine loop until interrupted."""
+        """Run main state machine loop until interrupted or asked to shut down."""
         try:
-            while True:
-                self._process_current_state()
-                self._periodic_state_save()
-                time.sleep(COLLECTION_INTERVAL_SECONDS)
+            while not self._shutdown_requested:
+                current_time = time.time()
+                current_monotonic = time.monotonic()
+                self._process_current_state(current_time, current_monotonic)
+                self.session_logger.flush()
+                self._periodic_state_save(current_monotonic)
+                self._wait_for_next_tick()
         except KeyboardInterrupt:
             logger.info("--- KeyboardInterrupt detected. Quitting ---")
+            return
+
+        logger.info("--- Received signal %s. Quitting ---", self._shutdown_signal)
 
     def _run_main_test_loop(self):
         """Run state machine loop for limited test duration."""
-        start_time = time.time()
-        test_duration = (
-            COLLECTION_INTERVAL_SECONDS * TEST_MODE_DURATION_MULTIPLIER
-            + TEST_MODE_BUFFER_SECONDS
+        next_tick_monotonic = time.monotonic()
+        deadline_monotonic = next_tick_monotonic + TEST_MODE_DURATION_SECONDS
+
+        while not self._shutdown_requested:
+            current_monotonic = time.monotonic()
+            if current_monotonic >= deadline_monotonic:
+                break
+            self._process_current_state(time.time(), current_monotonic)
+            self.session_logger.flush()
+            next_tick_monotonic = max(
+                next_tick_monotonic + COLLECTION_INTERVAL_SECONDS, current_monotonic
+            )
+            time.sleep(max(0.0, next_tick_monotonic - time.monotonic()))
+
+        logger.info(
+            "--- Test mode: Exiting after %s seconds. ---", TEST_MODE_DURATION_SECONDS
         )
 
-        while time.time() - start_time < test_duration:
-            self._process_current_state()
-            time.sleep(COLLECTION_INTERVAL_SECONDS)
+    def _wait_for_next_tick(self):
+        """Sleep until the next state deadline, waking on activity while IDLE."""
+        self._wakeup.clear()
+        # The wait is not woken by signals, so stop before it if one arrived this tick
+        if self._shutdown_requested:
+            return
+        if (
+            self.app_state.current_state is State.IDLE
+            and self.app_state.activation_candidate_start_monotonic is None
+        ):
+            self.activity_tracker.arm_wakeup()
+        self._wakeup.wait(self._seconds_until_next_deadline(time.monotonic()))
+
+    def _seconds_until_next_deadline(self, current_monotonic: float) -> float:
+        """Return seconds until the state machine can next change, capped per tick."""
+        if self.app_state.current_state is State.ACTIVE:
+            deadline = (
+                self.activity_tracker.get_last_activity_monotonic()
+                + self.config.break_duration_sec
+            )
+            if not self.app_state.break_reminder_shown:
+                deadline = min(
+                    deadline,
+                    self.app_state.session_start_monotonic
+                    + self.config.work_duration_sec,
+                )
+        elif self.app_state.activation_candidate_start_monotonic is not None:
+            deadline = (
+                self.app_state.activation_candidate_start_monotonic
+                + self.config.activation_threshold_sec
+            )
+        else:
+            return COLLECTION_INTERVAL_SECONDS
 
-        logger.info("--- Test mode: Exiting after %s seconds. ---", test_duration)
+        return min(COLLECTION_INTERVAL_SECONDS, max(0.0, deadline - current_monotonic))
 
-    def _process_current_state(self):
-        """Process current state and update state."""
-        if self.app_state.current_state == State.ACTIVE:
-            self.app_state = self.state_handler.handle_active_state(
-                self.app_state, self.config
-            )
-        elif self.app_state.current_state == State.IDLE:
-            self.app_state = self.state_handler.handle_idle_state(
-                self.app_state, self.config
+    def _process_current_state(self, current_time: float, current_monotonic: float):
+        """Process current state at the given tick timestamps and update state."""
+        handler = self._state_handlers.get(self.app_state.current_state)
+        if handler is not None:
+            self.app_state = handler(
+                self.app_state, self.config, current_time, current_monotonic
             )
 
-    def _periodic_state_save(self):
+    def _periodic_state_save(self, current_monotonic: float):
         """Periodically save state to disk to handle unexpected shutdowns."""
-        current_time = time.time()
-        if current_time - self.last_save_time >= self.config.break_duration_sec:
-            try:
-                self.state_persistence.save(
-                    self.config,
-                    self.app_state,
-                    self.activity_tracker.get_last_activity_time(),
-                )
-                self.last_save_time = current_time
-            except Exception:
-                logger.exception("Failed to save runtime state during periodic save")
+        if (
+            current_monotonic - self.last_save_monotonic
+            >= self.config.break_duration_sec
+        ):
+            self.state_writer.submit(
+                self.config,
+                self.app_state,
+                self.activity_tracker.get_last_activity_time(),
+            )
+            self.last_save_monotonic = current_monotonic
 
     def _cleanup_and_shutdown(self):
         """Cleanup and graceful shutdown of all components."""
         logger.info("Shutting down. Saving final session.")
-        self._log_final_session()
+        # Outside test mode the open session is resumed and logged once after a restart
+        if self.config.test_mode:
+            self._log_final_session()
+        self.session_logger.close()
+        self._save_runtime_state()
+
+        self.thread_manager.cleanup(self.all_threads)
+        logger.info("Listeners stopped. Exiting.")
 
+    def _save_runtime_state(self):
+        """Drain background saves, then save the current state synchronously once."""
+        if self._final_state_saved:
+            return
+        self._final_state_saved = True
+        if not self.state_writer.close():
+            # The worker may still be writing through the same StatePersistence
+            logger.warning("Skipping final runtime state save")
+            return
         try:
             self.state_persistence.save(
                 self.config,
@@ -276,18 +341,12 @@ class App:
                 self.activity_tracker.get_last_activity_time(),
             )
         except Exception:
-            logger.exception("Failed to save runtime state during cleanup")
-
-        self.thread_manager.cleanup(self.all_threads)
-        logger.info("Listeners stopped. Exiting.")
+            logger.exception("Failed to save runtime state")
 
     def _log_final_session(self):
         """Log final session if duration meets minimum threshold."""
         final_time = time.time()
-        try:
-            session_duration = time.monotonic() - self.app_state.session_start_monotonic
-        except Exception:
-            session_duration = final_time - self.app_state.session_start_time
+        session_duration = time.monotonic() - self.app_state.session_start_monotonic
 
         if session_duration > MINIMUM_SESSION_DURATION_SECONDS:
             self.session_logger.log(
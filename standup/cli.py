@@ -4,9 +4,6 @@ import click
 import logging
 from pathlib import Path
 
-from .app import App
-from .config_loader import ConfigLoader
-
 
 @click.command()
 @click.option(
@@ -16,6 +13,10 @@ from .config_loader import ConfigLoader
 )
 def cli(config_file: Path | None):
     """Start the activity monitor."""
+    # Imported here so --help does not load pynput or yaml
+    from .app import App
+    from .config_loader import ConfigLoader
+
     _setup_logging()
 
     config_loader = ConfigLoader()
@@ -1,9 +1,15 @@
 import logging
 from pathlib import Path
+from types import MappingProxyType
 import yaml
 
 from .model.app_config import AppConfig
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 logger = logging.getLogger(__name__)
 
 SECONDS_PER_MINUTE = 60
@@ -13,6 +19,7 @@ class ConfigLoader:
     """YAML configuration file loading and parsing."""
 
     DEFAULT_ACTIVATION_THRESHOLD_SECONDS = 10
+    ACTIVATION_GAP_DIVISOR = 10
     DEFAULT_CONFIG_FILE = "standup_config.yml"
     DEFAULT_WORK_TIME_MINUTES = 50
     DEFAULT_BREAK_TIME_MINUTES = 3
@@ -29,6 +36,14 @@ class ConfigLoader:
         "Wish you chose to live at a farm? Stand up and do 10 calf raises - up on your toes! 🦵",
         "Your mind's going crazy! Take 5 deep breaths - inhale for 4, exhale for 6! 🌬️",
     ]
+    REQUIRED_DEFAULTS = MappingProxyType(
+        {
+            "work_time_minutes": DEFAULT_WORK_TIME_MINUTES,
+            "break_time_minutes": DEFAULT_BREAK_TIME_MINUTES,
+            "csv_file": DEFAULT_CSV_FILE,
+            "state_file": DEFAULT_STATE_FILE,
+        }
+    )
 
     DEFAULT_CONFIG_TEMPLATE = """# Standup Activity Monitor Configuration File
 
@@ -81,8 +96,8 @@ break_messages:
             logger.info("Created default configuration file at '%s'", config_path)
 
         try:
-            with config_path.open("r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
+            with config_path.open("rb") as f:
+                config_data = yaml.load(f, Loader=YamlLoader)
 
             if not config_data:
                 config_data = {}
@@ -115,37 +130,13 @@ break_messages:
         updated = False
 
         # Fill in missing values with defaults
-        if "work_time_minutes" not in config_data:
-            config_data["work_time_minutes"] = self.DEFAULT_WORK_TIME_MINUTES
-            updated = True
-            logger.warning(
-                "Missing 'work_time_minutes' in config, using default: %s",
-                self.DEFAULT_WORK_TIME_MINUTES,
-            )
-
-        if "break_time_minutes" not in config_data:
-            config_data["break_time_minutes"] = self.DEFAULT_BREAK_TIME_MINUTES
-            updated = True
-            logger.warning(
-                "Missing 'break_time_minutes' in config, using default: %s",
-                self.DEFAULT_BREAK_TIME_MINUTES,
-            )
-
-        if "csv_file" not in config_data:
-            config_data["csv_file"] = self.DEFAULT_CSV_FILE
-            updated = True
-            logger.warning(
-                "Missing 'csv_file' in config, using default: %s",
-                self.DEFAULT_CSV_FILE,
-            )
-
-        if "state_file" not in config_data:
-            config_data["state_file"] = self.DEFAULT_STATE_FILE
-            updated = True
-            logger.warning(
-                "Missing 'state_file' in config, using default: %s",
-                self.DEFAULT_STATE_FILE,
-            )
+        for key, default in self.REQUIRED_DEFAULTS.items():
+            if key not in config_data:
+                config_data[key] = default
+                updated = True
+                logger.warning(
+                    "Missing '%s' in config, using default: %s", key, default
+                )
 
         work_time_minutes = config_data["work_time_minutes"]
         break_time_minutes = config_data["break_time_minutes"]
@@ -186,12 +177,16 @@ break_messages:
         state_path = Path(state_file_path)
         state_path.parent.mkdir(parents=True, exist_ok=True)
 
+        activation_threshold_sec = int(activation_threshold)
         return AppConfig(
             work_duration_sec=int(work_time_minutes) * SECONDS_PER_MINUTE,
             break_duration_sec=int(break_time_minutes) * SECONDS_PER_MINUTE,
             csv_file=csv_path,
             state_file=state_path,
             test_mode=bool(test_mode),
-            activation_threshold_sec=int(activation_threshold),
-            break_messages=break_messages,
+            activation_threshold_sec=activation_threshold_sec,
+            activation_max_gap_sec=(
+                activation_threshold_sec / self.ACTIVATION_GAP_DIVISOR
+            ),
+            break_messages=tuple(break_messages),
         )
@@ -11,4 +11,5 @@ class AppConfig(NamedTuple):
     state_file: Path
     test_mode: bool
     activation_threshold_sec: int
-    break_messages: list[str]
+    activation_max_gap_sec: float
+    break_messages: tuple[str, ...]
@@ -0,0 +1,12 @@
+from typing import NamedTuple
+
+from .state import State
+
+
+class SavedState(NamedTuple):
+    """Persisted runtime state; fields missing from the file are None."""
+
+    current_state: State | None
+    session_start_time: float | None
+    break_reminder_shown: bool
+    last_activity_time: float | None
@@ -12,4 +12,4 @@ class State(Enum):
 
 def state_to_activity(state: State) -> ActivityType:
     """Convert State enum to activity string: ACTIVE → 'Work', IDLE → 'Break'."""
-    return WORK_ACTIVITY if state == State.ACTIVE else BREAK_ACTIVITY
+    return WORK_ACTIVITY if state is State.ACTIVE else BREAK_ACTIVITY
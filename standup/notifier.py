@@ -1,20 +1,56 @@
 import logging
-from typing import cast
+import queue
+import threading
+from typing import TYPE_CHECKING, cast
 
-from windows_toasts import Toast, ToastDuration, WindowsToaster
+if TYPE_CHECKING:
+    from windows_toasts import WindowsToaster
 
 logger = logging.getLogger(__name__)
 
 
 class Notifier:
-    """Windows toast notification display."""
+    """Windows toast notification display on a background worker thread."""
 
     APP_NAME = "Standup!"
+    QUEUE_SIZE = 16
+
+    def __init__(self):
+        """Initialize the notification queue; the worker starts on first use."""
+        self._toaster: WindowsToaster | None = None
+        self._queue: queue.Queue[tuple[str, str, str]] = queue.Queue(
+            maxsize=self.QUEUE_SIZE
+        )
+        self._worker: threading.Thread | None = None
 
     def show(self, header: str, line1: str, line2: str = ""):
+        """Queue Windows toast notification with header and message lines."""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((header, line1, line2))
+        except queue.Full:
+            logger.warning("Notification queue full, dropping: %s", header)
+
+    def _ensure_worker(self):
+        """Start the daemon thread that displays queued notifications."""
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run_worker, name="notifier", daemon=True
+            )
+            self._worker.start()
+
+    def _run_worker(self):
+        """Display queued notifications one at a time until the process exits."""
+        while True:
+            header, line1, line2 = self._queue.get()
+            self._display(header, line1, line2)
+
+    def _display(self, header: str, line1: str, line2: str):
         """Display Windows toast notification with header and message lines."""
         try:
-            toaster = WindowsToaster(self.APP_NAME)
+            from windows_toasts import Toast, ToastDuration
+
+            toaster = self._get_toaster()
             message_lines = self._create_message_lines(header, line1, line2)
 
             new_toast = Toast(
@@ -24,8 +60,17 @@ class Notifier:
             toaster.show_toast(new_toast)
             logger.info("Notification: %s - %s", header, line1)
         except Exception as e:
+            self._toaster = None
             logger.error("Failed to show notification", exc_info=e)
 
+    def _get_toaster(self) -> "WindowsToaster":
+        """Return the cached toaster, creating it on first use."""
+        if self._toaster is None:
+            from windows_toasts import WindowsToaster
+
+            self._toaster = WindowsToaster(self.APP_NAME)
+        return self._toaster
+
     def _create_message_lines(self, header: str, line1: str, line2: str = "") -> list:
         """Create message lines list for toast notification."""
         message_lines = [header, line1]
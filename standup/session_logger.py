@@ -1,6 +1,8 @@
-import csv
 import logging
-from datetime import datetime
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 from .model.activity_type import ActivityType
 from .model.app_config import AppConfig
@@ -13,10 +15,29 @@ class SessionLogger:
     """CSV logging for work/break sessions."""
 
     DELIMITER = ";"
+    LINE_TERMINATOR = "\r\n"
     ENCODING = "utf-8"
+    FILE_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    FILE_MODE = 0o644
+    FLUSH_BATCH_SIZE = 32
+    FLUSH_INTERVAL_SECONDS = 10
     HEADER_FILE_POSITION = 0
     MINIMUM_SESSION_DURATION_SECONDS = 1
     COLUMNS = ["Activity Type", "Start Time", "End Time", "Duration (HH:MM:SS)"]
+    HEADER = (DELIMITER.join(COLUMNS) + LINE_TERMINATOR).encode(ENCODING)
+    # Activity names, ISO timestamps, and durations never need CSV quoting
+    ROW_TEMPLATE = DELIMITER.join(["{}"] * len(COLUMNS)) + LINE_TERMINATOR
+
+    def __init__(self):
+        """Initialize without an open log file; it is opened on first write."""
+        self._path: Path | None = None
+        self._fd: int | None = None
+        self._header_written = False
+        self._truncated_paths: set[Path] = set()
+        self._pending_config: AppConfig | None = None
+        self._pending_rows: list[str] = []
+        self._last_flush_monotonic = time.monotonic()
+        self._timezones: dict[int, timezone] = {}
 
     def log(
         self,
@@ -26,39 +47,97 @@ class SessionLogger:
         end_time: float,
         duration: float,
     ):
-        """Log completed session to CSV file with timestamps and duration."""
+        """Queue completed session for the CSV file with timestamps and duration."""
         if not config.csv_file:
             return
 
-        if not self._should_log_session(duration):
+        if duration <= self.MINIMUM_SESSION_DURATION_SECONDS:
             return
 
-        if config.test_mode:
-            config.csv_file.write_text("", encoding=self.ENCODING)
+        if (
+            self._pending_config is not None
+            and self._pending_config.csv_file != config.csv_file
+        ):
+            self.flush(force=True)
+
+        self._pending_config = config
+        self._pending_rows.append(
+            self._prepare_session_data(activity_type, start_time, end_time, duration)
+        )
+        self.flush()
+
+    def flush(self, force: bool = False):
+        """Write queued sessions once the batch is full or stale, or when forced."""
+        if not self._pending_rows:
+            return
+
+        if not force and not self._should_flush():
+            return
 
+        config = self._pending_config
         try:
-            with config.csv_file.open("a", newline="", encoding=self.ENCODING) as file:
-                writer = csv.DictWriter(
-                    file, fieldnames=self.COLUMNS, delimiter=self.DELIMITER
-                )
-
-                if self._should_write_header(file):
-                    writer.writeheader()
-
-                session_data = self._prepare_session_data(
-                    activity_type, start_time, end_time, duration
-                )
-                writer.writerow(session_data)
-        except IOError as e:
+            fd = self._open(config.csv_file, config.test_mode)
+            data = "".join(self._pending_rows).encode(self.ENCODING)
+            if not self._header_written:
+                data = self.HEADER + data
+            self._write_all(fd, data)
+            self._header_written = True
+        except OSError as e:
             logger.error("Failed to write to CSV", exc_info=e)
-
-    def _should_log_session(self, duration: float) -> bool:
-        """Check if session duration exceeds minimum threshold for logging."""
-        return duration > self.MINIMUM_SESSION_DURATION_SECONDS
-
-    def _should_write_header(self, file_handle) -> bool:
-        """Check if CSV header should be written based on file position."""
-        return file_handle.tell() == self.HEADER_FILE_POSITION
+        finally:
+            self._pending_rows.clear()
+            self._last_flush_monotonic = time.monotonic()
+
+    def close(self):
+        """Write queued sessions, sync them to disk, and close the open log file."""
+        self.flush(force=True)
+        if self._fd is not None:
+            try:
+                os.fsync(self._fd)
+            except OSError as e:
+                logger.error("Failed to sync CSV file", exc_info=e)
+        self._close_file()
+
+    def _close_file(self):
+        """Close the cached file descriptor."""
+        if self._fd is None:
+            return
+        try:
+            os.close(self._fd)
+        except OSError as e:
+            logger.error("Failed to close CSV file", exc_info=e)
+        finally:
+            self._path = None
+            self._fd = None
+
+    def _open(self, csv_file: Path, truncate: bool) -> int:
+        """Return the cached append-only descriptor, reopening if the path changed."""
+        if self._fd is None or self._path != csv_file:
+            self._close_file()
+            flags = self.FILE_FLAGS
+            if truncate and csv_file not in self._truncated_paths:
+                flags |= os.O_TRUNC
+                self._truncated_paths.add(csv_file)
+            self._fd = os.open(csv_file, flags, self.FILE_MODE)
+            self._path = csv_file
+            self._header_written = (
+                os.fstat(self._fd).st_size != self.HEADER_FILE_POSITION
+            )
+        return self._fd
+
+    def _write_all(self, fd: int, data: bytes):
+        """Write all bytes to the descriptor, retrying short writes."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+    def _should_flush(self) -> bool:
+        """Check if enough sessions are queued or the oldest flush is stale."""
+        return (
+            len(self._pending_rows) >= self.FLUSH_BATCH_SIZE
+            or time.monotonic() - self._last_flush_monotonic
+            >= self.FLUSH_INTERVAL_SECONDS
+        )
 
     def _prepare_session_data(
         self,
@@ -66,19 +145,26 @@ class SessionLogger:
         start_time: float,
         end_time: float,
         duration: float,
-    ) -> dict:
-        """Prepare formatted session data dict for CSV logging."""
+    ) -> str:
+        """Prepare formatted CSV line in COLUMNS order for session logging."""
         formatted_start, formatted_end = self._format_timestamps(start_time, end_time)
 
-        return {
-            "Activity Type": activity_type,
-            "Start Time": formatted_start,
-            "End Time": formatted_end,
-            "Duration (HH:MM:SS)": format_duration(duration),
-        }
+        return self.ROW_TEMPLATE.format(
+            activity_type,
+            formatted_start,
+            formatted_end,
+            format_duration(duration),
+        )
 
     def _format_timestamps(self, start_time: float, end_time: float) -> tuple[str, str]:
         """Format start and end timestamps to ISO format strings."""
-        formatted_start = datetime.fromtimestamp(start_time).astimezone().isoformat()
-        formatted_end = datetime.fromtimestamp(end_time).astimezone().isoformat()
-        return formatted_start, formatted_end
+        return self._format_timestamp(start_time), self._format_timestamp(end_time)
+
+    def _format_timestamp(self, timestamp: float) -> str:
+        """Format timestamp as ISO string in the local timezone at that instant."""
+        utc_offset = time.localtime(timestamp).tm_gmtoff
+        local_timezone = self._timezones.get(utc_offset)
+        if local_timezone is None:
+            local_timezone = timezone(timedelta(seconds=utc_offset))
+            self._timezones[utc_offset] = local_timezone
+        return datetime.fromtimestamp(timestamp, local_timezone).isoformat()
@@ -1,6 +1,4 @@
 import logging
-import time
-import math
 import random
 
 from .activity_tracker import ActivityTracker
@@ -19,7 +17,7 @@ class StateHandler:
 
     MINIMUM_LOG_DURATION_SECONDS = 1
     SLEEP_DETECTION_THRESHOLD_SECONDS = 60
-    ACTIVATION_GAP_DIVISOR = 10
+    SECONDS_PER_PUSHUP = 600
 
     def __init__(
         self,
@@ -32,13 +30,19 @@ class StateHandler:
         self._session_logger = session_logger
         self._notifier = notifier
 
-    def handle_active_state(self, app_state: AppState, config: AppConfig) -> AppState:
+    def handle_active_state(
+        self,
+        app_state: AppState,
+        config: AppConfig,
+        current_time: float,
+        current_monotonic: float,
+    ) -> AppState:
         """Handle ACTIVE state: check for IDLE transition and break reminders."""
-        current_time = time.time()
-        current_monotonic = time.monotonic()
-        time_since_last_activity = self._calculate_time_since_activity()
+        time_since_last_activity = self._calculate_time_since_activity(
+            current_time, current_monotonic
+        )
 
-        if self._should_transition_to_idle(time_since_last_activity, config):
+        if time_since_last_activity >= config.break_duration_sec:
             return self._transition_to_idle_state(
                 app_state, config, current_time, current_monotonic
             )
@@ -52,24 +56,29 @@ class StateHandler:
 
         return app_state
 
-    def handle_idle_state(self, app_state: AppState, config: AppConfig) -> AppState:
+    def handle_idle_state(
+        self,
+        app_state: AppState,
+        config: AppConfig,
+        current_time: float,
+        current_monotonic: float,
+    ) -> AppState:
         """Handle IDLE state: check for ACTIVE transition with sustained activity."""
-        current_time = time.time()
-        current_monotonic = time.monotonic()
-        time_since_last_activity = self._calculate_time_since_activity()
-
-        max_inter_event_gap = (
-            config.activation_threshold_sec / self.ACTIVATION_GAP_DIVISOR
+        time_since_last_activity = self._calculate_time_since_activity(
+            current_time, current_monotonic
         )
+
+        candidate = app_state.activation_candidate_start_monotonic
+
+        # The activation gap is normally far shorter than a break, so test it first
         if (
-            time_since_last_activity >= config.break_duration_sec
-            or time_since_last_activity >= max_inter_event_gap
+            time_since_last_activity >= config.activation_max_gap_sec
+            or time_since_last_activity >= config.break_duration_sec
         ):
-            if app_state.activation_candidate_start_monotonic is not None:
-                return app_state._replace(activation_candidate_start_monotonic=None)
-            return app_state
+            if candidate is None:
+                return app_state
+            return app_state._replace(activation_candidate_start_monotonic=None)
 
-        candidate = app_state.activation_candidate_start_monotonic
         if candidate is None:
             return app_state._replace(
                 activation_candidate_start_monotonic=current_monotonic
@@ -82,41 +91,24 @@ class StateHandler:
 
         return app_state
 
-    def _calculate_time_since_activity(self) -> float:
-        """Calculate seconds elapsed since last user activity."""
-        now_wall = time.time()
-        now_mono = time.monotonic()
-        try:
-            last_wall = self._activity_tracker.get_last_activity_time()
-            last_mono = self._activity_tracker.get_last_activity_monotonic()
-            delta_wall = now_wall - last_wall
-            delta_mono = now_mono - last_mono
-            if delta_wall - delta_mono > self.SLEEP_DETECTION_THRESHOLD_SECONDS:
-                return delta_wall
-            return delta_mono
-        except Exception:
-            return now_wall - self._activity_tracker.get_last_activity_time()
-
-    def _should_transition_to_idle(
-        self, time_since_last_activity: float, config: AppConfig
-    ) -> bool:
-        """Check if inactivity duration exceeds break threshold."""
-        return time_since_last_activity >= config.break_duration_sec
+    def _calculate_time_since_activity(
+        self, current_time: float, current_monotonic: float
+    ) -> float:
+        """Calculate seconds elapsed since last user activity at the given tick."""
+        last_wall, last_mono = self._activity_tracker.get_last_activity()
+        delta_wall = current_time - last_wall
+        delta_mono = current_monotonic - last_mono
+        if delta_wall - delta_mono > self.SLEEP_DETECTION_THRESHOLD_SECONDS:
+            return delta_wall
+        return delta_mono
 
     def _calculate_session_duration(
         self, app_state: AppState, current_time: float, current_monotonic: float
     ) -> float:
         """Calculate current session duration handling system sleep/wake."""
-        try:
-            delta_mono = current_monotonic - app_state.session_start_monotonic
-        except Exception:
-            delta_mono = None
-
+        delta_mono = current_monotonic - app_state.session_start_monotonic
         delta_wall = current_time - app_state.session_start_time
 
-        if delta_mono is None:
-            return delta_wall
-
         if delta_wall - delta_mono > self.SLEEP_DETECTION_THRESHOLD_SECONDS:
             return delta_wall
 
@@ -130,17 +122,12 @@ class StateHandler:
         current_monotonic: float,
     ) -> bool:
         """Check if work duration exceeds threshold and reminder not yet shown."""
+        if app_state.break_reminder_shown:
+            return False
         work_duration = self._calculate_session_duration(
             app_state, current_time, current_monotonic
         )
-        return (
-            not app_state.break_reminder_shown
-            and work_duration >= config.work_duration_sec
-        )
-
-    def _should_log_session(self, session_duration: float) -> bool:
-        """Check if session duration exceeds minimum logging threshold."""
-        return session_duration > self.MINIMUM_LOG_DURATION_SECONDS
+        return work_duration >= config.work_duration_sec
 
     def _transition_to_idle_state(
         self,
@@ -155,7 +142,7 @@ class StateHandler:
             app_state, current_time, current_monotonic
         )
 
-        if self._should_log_session(session_duration):
+        if session_duration > self.MINIMUM_LOG_DURATION_SECONDS:
             self._session_logger.log(
                 config,
                 state_to_activity(app_state.current_state),
@@ -185,7 +172,7 @@ class StateHandler:
             app_state, current_time, current_monotonic
         )
 
-        if self._should_log_session(break_duration):
+        if break_duration > self.MINIMUM_LOG_DURATION_SECONDS:
             self._notifier.show(
                 "Welcome Back!",
                 f"Your break lasted {format_duration(break_duration)}.",
@@ -218,9 +205,7 @@ class StateHandler:
         session_duration_seconds = self._calculate_session_duration(
             app_state, current_time, current_monotonic
         )
-        pushups_per_minute = 1 / 10
-        pushups_per_second = pushups_per_minute / 60
-        pushups_to_do = math.ceil(session_duration_seconds * pushups_per_second)
+        pushups_to_do = -(-int(session_duration_seconds) // self.SECONDS_PER_PUSHUP)
 
         # Select a random message from config
         break_message = random.choice(config.break_messages)
@@ -1,8 +1,12 @@
 import json
 import logging
+import os
 from pathlib import Path
 
 from .model.app_config import AppConfig
+from .model.app_state import AppState
+from .model.saved_state import SavedState
+from .model.state import State
 
 logger = logging.getLogger(__name__)
 
@@ -11,37 +15,49 @@ class StatePersistence:
     """Runtime state persistence to disk for session resumption."""
 
     ENCODING = "utf-8"
+    TEMP_SUFFIX = ".tmp"
 
-    def save(self, config: AppConfig | None, app_state, last_activity_time: float):
+    def __init__(self):
+        """Initialize without a record of previously written state."""
+        self._last_written: tuple[Path, bytes] | None = None
+        self._created_dirs: set[Path] = set()
+
+    def save(
+        self, config: AppConfig | None, app_state: AppState, last_activity_time: float
+    ):
         """Save runtime state to disk for session resumption after restart."""
         state_file = self._get_state_file_path(config)
         state = {
-            "current_state": getattr(
-                app_state.current_state, "name", str(app_state.current_state)
-            ),
-            "session_start_time": float(getattr(app_state, "session_start_time", 0)),
-            "break_reminder_shown": bool(
-                getattr(app_state, "break_reminder_shown", False)
-            ),
-            "last_activity_time": float(last_activity_time),
+            "current_state": app_state.current_state.name,
+            "session_start_time": app_state.session_start_time,
+            "break_reminder_shown": app_state.break_reminder_shown,
+            "last_activity_time": last_activity_time,
         }
 
+        data = json.dumps(state).encode(self.ENCODING)
+        if self._last_written == (state_file, data):
+            return
+
         try:
-            state_file.parent.mkdir(parents=True, exist_ok=True)
-            state_file.write_text(json.dumps(state), encoding=self.ENCODING)
+            if state_file.parent not in self._created_dirs:
+                state_file.parent.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(state_file.parent)
+            self._write_atomic(state_file, data)
+            self._last_written = (state_file, data)
             logger.info("Saved runtime state to %s", state_file)
         except Exception as e:
             logger.error("Failed to save runtime state", exc_info=e)
 
-    def load(self, config: AppConfig | None):
+    def load(self, config: AppConfig | None) -> SavedState | None:
         """Load previously saved runtime state from disk or return None."""
         state_file = self._get_state_file_path(config)
         if not state_file.exists():
             return None
         try:
             data = json.loads(state_file.read_text(encoding=self.ENCODING))
+            saved = self._parse_saved_state(data)
             logger.info("Loaded runtime state from %s", state_file)
-            return data
+            return saved
         except Exception as e:
             logger.error("Failed to load runtime state", exc_info=e)
             return None
@@ -49,6 +65,7 @@ class StatePersistence:
     def clear(self, config: AppConfig | None):
         """Remove saved runtime state file if present."""
         state_file = self._get_state_file_path(config)
+        self._last_written = None
         try:
             if state_file.exists():
                 state_file.unlink()
@@ -56,6 +73,30 @@ class StatePersistence:
         except Exception:
             logger.exception("Failed to clear runtime state file")
 
+    def _write_atomic(self, state_file: Path, data: bytes):
+        """Write bytes to a temporary file, sync it, and swap it into place."""
+        temp_file = state_file.with_name(state_file.name + self.TEMP_SUFFIX)
+        with temp_file.open("wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, state_file)
+
+    def _parse_saved_state(self, data: dict) -> SavedState:
+        """Convert decoded JSON into a typed saved state, leaving missing fields None."""
+        session_start_time = data.get("session_start_time")
+        last_activity_time = data.get("last_activity_time")
+        return SavedState(
+            current_state=State.__members__.get(data.get("current_state")),
+            session_start_time=(
+                None if session_start_time is None else float(session_start_time)
+            ),
+            break_reminder_shown=bool(data.get("break_reminder_shown", False)),
+            last_activity_time=(
+                None if last_activity_time is None else float(last_activity_time)
+            ),
+        )
+
     def _get_state_file_path(self, config: AppConfig | None) -> Path:
         """Get state file path from config or raise if missing."""
         if not config:
@@ -0,0 +1,68 @@
+import logging
+import threading
+
+from .model.app_config import AppConfig
+from .model.app_state import AppState
+from .state_persistence import StatePersistence
+
+logger = logging.getLogger(__name__)
+
+
+class StateWriter:
+    """Background runtime state saving where only the latest pending state is written."""
+
+    CLOSE_TIMEOUT_SECONDS = 2
+
+    def __init__(self, state_persistence: StatePersistence):
+        """Initialize with a state persistence; the worker starts on first submit."""
+        self._state_persistence = state_persistence
+        self._condition = threading.Condition()
+        self._pending: tuple[AppConfig, AppState, float] | None = None
+        self._closed = False
+        self._worker: threading.Thread | None = None
+
+    def submit(self, config: AppConfig, app_state: AppState, last_activity_time: float):
+        """Queue state for saving, replacing any state not yet written."""
+        with self._condition:
+            if self._closed:
+                return
+            self._ensure_worker()
+            self._pending = (config, app_state, last_activity_time)
+            self._condition.notify_all()
+
+    def close(self) -> bool:
+        """Stop the worker after draining; return False if it is still running."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._worker is None:
+            return True
+        self._worker.join(self.CLOSE_TIMEOUT_SECONDS)
+        if self._worker.is_alive():
+            logger.warning("State writer did not finish within timeout")
+            return False
+        return True
+
+    def _ensure_worker(self):
+        """Start the daemon thread that writes submitted states."""
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run_worker, name="state-writer", daemon=True
+            )
+            self._worker.start()
+
+    def _run_worker(self):
+        """Write the latest submitted state until closed and drained."""
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                config, app_state, last_activity_time = self._pending
+                self._pending = None
+
+            try:
+                self._state_persistence.save(config, app_state, last_activity_time)
+            except Exception:
+                logger.exception("Failed to save runtime state in background")
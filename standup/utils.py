@@ -1,6 +1,15 @@
 from datetime import timedelta
 
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_DAY = 86400
+
 
 def format_duration(seconds: float) -> str:
     """Format seconds as HH:MM:SS string."""
-    return str(timedelta(seconds=int(seconds)))
+    total = int(seconds)
+    if not 0 <= total < SECONDS_PER_DAY:
+        return str(timedelta(seconds=total))
+    hours, remainder = divmod(total, SECONDS_PER_HOUR)
+    minutes, secs = divmod(remainder, SECONDS_PER_MINUTE)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
@@ -0,0 +1,71 @@
+import csv
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from standup.config_loader import ConfigLoader
+from standup.model.state import State
+
+try:
+    from standup.app import App
+except ImportError:  # pynput needs a desktop session
+    App = None
+
+
+@unittest.skipIf(App is None, "pynput is not available")
+class RestartTest(unittest.TestCase):
+    """Sessions interrupted by a shutdown are logged once across a restart."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        directory = Path(self._tmp.name)
+        self.config = (
+            ConfigLoader()
+            .load(directory / "config.yml")
+            ._replace(
+                csv_file=directory / "log.csv", state_file=directory / "state.json"
+            )
+        )
+
+    def _start_app(self) -> App:
+        app = App(self.config)
+        app._resume_from_saved_state()
+        return app
+
+    def _read_rows(self) -> list[list[str]]:
+        with self.config.csv_file.open(newline="", encoding="utf-8") as f:
+            return list(csv.reader(f, delimiter=";"))[1:]
+
+    def test_active_session_is_logged_once_after_restart(self):
+        app = self._start_app()
+        now = time.time()
+        now_monotonic = time.monotonic()
+        app.app_state = app.app_state._replace(
+            current_state=State.ACTIVE,
+            session_start_time=now - 120,
+            session_start_monotonic=now_monotonic - 120,
+        )
+        app.activity_tracker.set_last_activity_time(now, now_monotonic)
+        app._cleanup_and_shutdown()
+
+        restarted = self._start_app()
+        self.assertIs(restarted.app_state.current_state, State.ACTIVE)
+        idle_offset = self.config.break_duration_sec + 1
+        restarted.app_state = restarted.state_handler.handle_active_state(
+            restarted.app_state,
+            self.config,
+            time.time() + idle_offset,
+            time.monotonic() + idle_offset,
+        )
+        self.assertIs(restarted.app_state.current_state, State.IDLE)
+        restarted._cleanup_and_shutdown()
+
+        rows = self._read_rows()
+        self.assertEqual([row[0] for row in rows], ["Work"])
+        self.assertEqual(len({row[1] for row in rows}), len(rows))
+
+
+if __name__ == "__main__":
+    unittest.main()